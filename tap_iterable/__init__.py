@@ -1,30 +1,84 @@
 """Tap for Iterable."""
 
+from __future__ import annotations
+
+import typing as t
 from collections import deque
 
 from typing_extensions import Self, override
 
 
+def _sizeof(item) -> int:
+    return len(str(item))
+
+
 class BufferDeque(deque):
     """Specialized deque with context manager support for conditional flushing."""
 
     _flush = False
 
+    @override
+    def __init__(
+        self,
+        *args,
+        max_size: int | None = None,
+        sizeof: t.Callable[[t.Any], int] = _sizeof,
+        **kwargs,
+    ) -> None:
+        """Initialize the buffer.
+
+        Args:
+            args: Positional arguments passed to `deque`.
+            max_size: Total size of items at which the buffer is considered full,
+                regardless of `maxlen`.
+            sizeof: Function used to determine the size of an item.
+            kwargs: Keyword arguments passed to `deque`.
+        """
+        super().__init__(*args, **kwargs)
+        self.max_size = max_size
+        self._sizeof = sizeof
+        self._size = sum(map(sizeof, self))
+
+    @property
+    def full(self) -> bool:
+        """Indicates whether the buffer has reached its maximum length or size."""
+        return len(self) == self.maxlen or (
+            self.max_size is not None and self._size >= self.max_size
+        )
+
     @property
     def flush(self) -> bool:
         """Indicates whether the buffer is marked for flushing."""
         return self._flush
 
+    @property
+    def ready(self) -> bool:
+        """Indicates whether the buffer is full or marked for flushing."""
+        return self._flush or self.full
+
     def finalize(self):
         """Manually set the buffer to flush on exit."""
         self._flush = True
 
+    @override
+    def append(self, item) -> None:
+        if len(self) == self.maxlen:
+            self._size -= self._sizeof(self[0])  # evicted on append
+
+        super().append(item)
+        self._size += self._sizeof(item)
+
+    @override
+    def clear(self) -> None:
+        super().clear()
+        self._size = 0
+
     def __enter__(self) -> Self:
         """Enter the runtime context.
 
         Checks if the buffer is full and sets the flush flag accordingly.
         """
-        self._flush |= len(self) == self.maxlen
+        self._flush |= self.full
         return self
 
     def __exit__(self, *args) -> None:
@@ -44,7 +98,7 @@ class BufferDeque(deque):
 
         if not size:
             descriptor = "empty"
-        elif size == self.maxlen:
+        elif self.full:
             descriptor = "full"
         else:
             descriptor = "active"
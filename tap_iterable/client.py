@@ -2,16 +2,29 @@
 
 from __future__ import annotations
 
+import decimal
+import re
 from datetime import datetime, timezone
 from functools import cached_property
 from importlib import resources
 
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
 from singer_sdk.authenticators import APIKeyAuthenticator
 from singer_sdk.pagination import BaseAPIPaginator  # noqa: TC002
 from singer_sdk.streams import RESTStream
 from typing_extensions import override
 
 SCHEMAS_DIR = resources.files(__package__) / "schemas"
+DATE_TIME_FORMAT = r"%Y-%m-%d %H:%M:%S"
+
+_RECORDS_KEY_JSONPATH_PATTERN = re.compile(r"\$\.(\w+)\[\*\]")
+
+
+def _timestamp_to_iso(value: int) -> str:
+    return datetime.fromtimestamp(
+        value / 1000,  # assume timestamp in milliseconds
+        tz=timezone.utc,
+    ).isoformat()
 
 
 class IterableStream(RESTStream):
@@ -21,6 +34,10 @@ class IterableStream(RESTStream):
     # none support pagination anyway)
     next_page_token_jsonpath = None
 
+    # defer downloading the response body until it is read, for streams that process
+    # response content incrementally
+    stream_response = False
+
     @override
     @cached_property
     def url_base(self):
@@ -29,6 +46,22 @@ class IterableStream(RESTStream):
 
         return "https://api.iterable.com/api"
 
+    @override
+    @cached_property
+    def requests_session(self):
+        session = super().requests_session
+
+        # keep a pooled connection per concurrent request, rather than discarding
+        # connections beyond the default pool size as requests complete
+        if self._concurrency > DEFAULT_POOLSIZE:
+            session.mount("https://", HTTPAdapter(pool_maxsize=self._concurrency))
+
+        return session
+
+    @property
+    def _concurrency(self) -> int:
+        return 1
+
     @override
     @property
     def authenticator(self):
@@ -65,39 +98,68 @@ class IterableStream(RESTStream):
         """
         return super().get_new_paginator()
 
+    @override
+    def _request(self, prepared_request, context):
+        response = self.requests_session.send(
+            prepared_request,
+            stream=self.stream_response,
+            timeout=self.timeout,
+            allow_redirects=self.allow_redirects,
+        )
+        self._write_request_duration_log(
+            endpoint=self.path,
+            response=response,
+            context=context,
+            extra_tags={"url": prepared_request.path_url}
+            if self._LOG_REQUEST_METRIC_URLS
+            else None,
+        )
+        self.validate_response(response)
+
+        return response
+
     @override
     def get_url_params(self, context, next_page_token):
         params = super().get_url_params(context, next_page_token)
 
         if start_date := self.get_starting_timestamp(context):
-            params["startDateTime"] = start_date.strftime(r"%Y-%m-%d %H:%M:%S")
+            params["startDateTime"] = start_date.strftime(DATE_TIME_FORMAT)
 
         return params
 
+    @cached_property
+    def _records_key(self):
+        match = _RECORDS_KEY_JSONPATH_PATTERN.fullmatch(self.records_jsonpath)
+        return match and match[1]
+
+    @override
+    def parse_response(self, response):
+        if not self._records_key:
+            yield from super().parse_response(response)
+            return
+
+        # `$.<key>[*]` selects the records array directly, so skip JSONPath evaluation
+        data: dict = response.json(parse_float=decimal.Decimal)
+        yield from data.get(self._records_key) or ()
+
     @cached_property
     def _date_time_properties(self):
         properties: dict[str, dict] = self.schema["properties"]
 
-        return {
+        return tuple(
             name
             for name, schema in properties.items()
             if schema.get("format") == "date-time"
-        }
+        )
 
     @override
     def post_process(self, row, context=None):
         for name in self._date_time_properties:
             value = row.get(name)
 
-            if not value:
-                continue
-
-            if isinstance(value, int):
-                value = datetime.fromtimestamp(
-                    value / 1000,  # assume timestamp in milliseconds
-                    tz=timezone.utc,
-                ).isoformat()
-
-            row[name] = value
+            # values are most commonly already strings, so only convert non-zero
+            # integer timestamps (exact type check is cheaper than `isinstance`)
+            if type(value) is int and value:
+                row[name] = _timestamp_to_iso(value)
 
         return row
@@ -17,6 +17,7 @@ class DateTimeIntervalPaginator(BaseAPIPaginator[DateTimeIntervalTokenType]):
     @override
     def __init__(self, *, start: datetime, interval: timedelta) -> None:
         self.interval = interval
+        self._now = datetime.now(tz=timezone.utc)
         super().__init__(self._get_date_range(start))
 
     @override
@@ -35,5 +36,9 @@ class DateTimeIntervalPaginator(BaseAPIPaginator[DateTimeIntervalTokenType]):
     def _get_date_range(self, start: datetime) -> DateTimeIntervalTokenType:
         end = start + self.interval
 
+        # only get the current time again once the last known date range is reached
+        if end >= self._now:
+            self._now = datetime.now(tz=timezone.utc)
+
         # `startDateTime` is inclusive, `endDateTime` is exclusive
-        return start, end if end < datetime.now(tz=timezone.utc) else None
+        return start, end if end < self._now else None
@@ -2,28 +2,42 @@
 
 from __future__ import annotations
 
+import contextlib
 import csv
-import decimal
 import io
 import itertools
-import json
 import math
 import re
+import shutil
 import tempfile
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import timedelta
+from functools import cached_property, lru_cache
 from importlib import resources
-from pathlib import Path
 
 import humps
+import orjson
+from singer_sdk import metrics
 from singer_sdk import typing as th
 from singer_sdk.streams import Stream
 from typing_extensions import override
 
 from tap_iterable import BufferDeque
-from tap_iterable.client import IterableStream
+from tap_iterable.client import DATE_TIME_FORMAT, IterableStream
 from tap_iterable.pagination import DateTimeIntervalPaginator, DateTimeIntervalTokenType
 
 SCHEMAS_DIR = resources.files(__package__) / "schemas"
+EXPORT_DOWNLOAD_CHUNK_SIZE = 8 * 1024**2  # 8 MB
+
+_WHITESPACE_PATTERN = re.compile(r"\s")
+_NON_WORD_PATTERN = re.compile(r"\W")
+
+
+@lru_cache(maxsize=512)
+def _normalize_key(key: str) -> str:
+    key = _WHITESPACE_PATTERN.sub("_", key.lower().replace("/ m", "per mile"))
+    return humps.camelize(_NON_WORD_PATTERN.sub("", key))
 
 
 class ListsStream(IterableStream):
@@ -48,6 +62,7 @@ class ListUsersStream(IterableStream):
     path = "/lists/getUsers"
     schema_filepath = SCHEMAS_DIR / "list_users.json"
     primary_keys = ("email", "listId")
+    stream_response = True
 
     @override
     def get_url_params(self, context, next_page_token):
@@ -58,7 +73,10 @@ class ListUsersStream(IterableStream):
 
     @override
     def parse_response(self, response):
-        yield from ({"email": line} for line in response.iter_lines())
+        with response:  # ensure connection is eventually released
+            for line in response.iter_lines(chunk_size=64 * 1024):  # 64 KB
+                if line:
+                    yield {"email": line.decode()}
 
     @override
     def post_process(self, row, context=None):
@@ -79,24 +97,36 @@ class CampaignsStream(IterableStream):
     @override
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
-        self._campaign_ids_buffer = BufferDeque(maxlen=50)
+
+        # batch as many campaign IDs as will reasonably fit in a request URL, where each
+        # is sent as a separate `campaignId` query parameter
+        self._campaign_ids_buffer = BufferDeque(
+            maxlen=400,
+            max_size=6000,
+            sizeof=lambda campaign_id: len(f"campaignId={campaign_id}&"),
+        )
 
     @override
-    def parse_response(self, response):
-        for record in super().parse_response(response):
-            yield record
+    def get_records(self, context):
+        yield from super().get_records(context)
 
         # make sure we process the remaining buffer entries
         self._campaign_ids_buffer.finalize()
-        yield record  # yield last record again to force child context generation
+
+        with self._campaign_ids_buffer as buf:
+            if buf:
+                self._sync_children({"campaign_ids": tuple(buf)})
 
     @override
     def generate_child_contexts(self, record, context):
         self._campaign_ids_buffer.append(record["id"])
 
+        # avoid entering the buffer context for every record
+        if not self._campaign_ids_buffer.ready:
+            return
+
         with self._campaign_ids_buffer as buf:
-            if buf.flush:
-                yield {"campaign_ids": buf}
+            yield {"campaign_ids": tuple(buf)}  # snapshot before the buffer is flushed
 
 
 class ChannelsStream(IterableStream):
@@ -157,7 +187,7 @@ class TemplatesStream(IterableStream):
         params["messageMedium"] = context["messageMedium"]
 
         if start_date := self.get_starting_timestamp(context):
-            params["startDateTime"] = start_date.strftime(r"%Y-%m-%d %H:%M:%S")
+            params["startDateTime"] = start_date.strftime(DATE_TIME_FORMAT)
 
         return params
 
@@ -218,21 +248,48 @@ class _MetadataTablesStream(IterableStream):
     path = "/metadata/{table}"
     schema = th.ObjectType().to_dict()
     selected = False  # use for context generation only
-    records_jsonpath = "$.results[*]"
-
-    @override
-    def get_child_context(self, record, context):
-        return {**context, "key": record["key"]}
+    records_jsonpath = "$.results[*]"  # used to list keys only (see `MetadataStream`)
 
 
 class MetadataStream(IterableStream):
     """Define metadata stream."""
 
-    parent_stream_type = _MetadataTablesStream
+    parent_stream_type = _MetadataStream
     name = "metadata"
     path = "/metadata/{table}/{key}"
     schema_filepath = SCHEMAS_DIR / "metadata.json"
     primary_keys = ("table", "key")
+    state_partitioning_keys = ("table",)
+
+    @override
+    @property
+    def _concurrency(self):
+        return self.config.get("metadata_concurrency") or 1
+
+    @cached_property
+    def _tables_stream(self) -> _MetadataTablesStream:
+        return self._tap.streams[_MetadataTablesStream.name]
+
+    @override
+    def get_records(self, context):
+        # list keys for the table here rather than passing them through the child
+        # context, which is logged and tagged on sync metrics as a whole
+        keys = [record["key"] for record in self._tables_stream.get_records(context)]
+
+        def request_key_records(key: str):
+            return [
+                {"key": key, **record}
+                for record in self.request_records({**context, "key": key})
+            ]
+
+        executor = ThreadPoolExecutor(self._concurrency, thread_name_prefix=self.name)
+
+        try:
+            for records in executor.map(request_key_records, keys):
+                yield from records
+        finally:
+            # don't wait on requests still in flight if processing stops early
+            executor.shutdown(wait=False, cancel_futures=True)
 
 
 # https://api.iterable.com/api/docs#export_exportDataJson
@@ -241,13 +298,16 @@ class _ExportStream(IterableStream):
 
     path = "/export/data.json"
     replication_key = "createdAt"
+    stream_response = True
 
     data_type_name: str
 
     @override
-    @property
-    def schema_filepath(self):
-        return SCHEMAS_DIR / f"{self.name}.json"
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+
+        if name := cls.__dict__.get("name"):
+            cls.schema_filepath = SCHEMAS_DIR / f"{name}.json"
 
     @override
     def get_new_paginator(self):
@@ -262,60 +322,123 @@ class _ExportStream(IterableStream):
 
         return {
             "dataTypeName": self.data_type_name,
-            "startDateTime": start.strftime(r"%Y-%m-%d %H:%M:%S"),
-            "endDateTime": end and end.strftime(r"%Y-%m-%d %H:%M:%S"),
+            "startDateTime": start.strftime(DATE_TIME_FORMAT),
+            "endDateTime": end and end.strftime(DATE_TIME_FORMAT),
         }
 
-    @override
-    def _request(self, prepared_request, context):
-        response = self.requests_session.send(
-            prepared_request,
-            stream=True,  # streaming request
-            timeout=self.timeout,
-            allow_redirects=self.allow_redirects,
-        )
-        self._write_request_duration_log(
-            endpoint=self.path,
-            response=response,
-            context=context,
-            extra_tags={"url": prepared_request.path_url}
-            if self._LOG_REQUEST_METRIC_URLS
-            else None,
-        )
-        self.validate_response(response)
-
-        return response
-
     @override
     def backoff_max_tries(self):
         return 8
 
     @override
-    def parse_response(self, response):
-        with tempfile.TemporaryDirectory(prefix=f"{self.tap_name}-") as tmpdir:
-            filepath = Path(tmpdir) / f"{self.name}.jsonl"
+    @property
+    def _concurrency(self):
+        return self.config.get("export_concurrency") or 1
+
+    @override
+    def request_records(self, context):
+        concurrency = self._concurrency
+
+        if concurrency <= 1:
+            yield from super().request_records(context)
+            return
+
+        date_ranges = self._get_date_ranges()
+        executor = ThreadPoolExecutor(concurrency, thread_name_prefix=self.name)
+        downloads: deque[Future] = deque()
+
+        try:
+            with metrics.http_request_counter(self.name, self.path) as request_counter:
+                request_counter.context = context
+
+                # download date ranges concurrently while keeping at most `concurrency`
+                # downloads in flight, and process them in order to preserve state
+                downloads.extend(
+                    executor.submit(self._download, context, date_range)
+                    for date_range in itertools.islice(date_ranges, concurrency)
+                )
+
+                while downloads:
+                    prepared_request, response, f = downloads.popleft().result()
+
+                    if date_range := next(date_ranges, None):
+                        downloads.append(
+                            executor.submit(self._download, context, date_range)
+                        )
+
+                    request_counter.increment()
+                    self.update_sync_costs(prepared_request, response, context)
+
+                    with f:
+                        yield from self._parse_lines(f)
+
+                    self._finalize_state(self.stream_state)
+        finally:
+            # don't wait on downloads still in flight if processing stops early (e.g. a
+            # max records limit is reached or an error is raised downstream), and
+            # release the buffers of any that completed without being processed
+            executor.shutdown(wait=False, cancel_futures=True)
+
+            for download in downloads:
+                download.add_done_callback(self._discard_download)
+
+    @staticmethod
+    def _discard_download(download: Future) -> None:
+        if download.cancelled() or download.exception():
+            return
+
+        _, _, f = download.result()
+        f.close()
 
-            with (
-                response,  # ensure connection is eventually released
-                filepath.open("wb") as f,
-            ):
-                self.logger.info("Writing file: %s", f.name)
-                for chunk in response.iter_content(1024**2):  # 1 MB
-                    f.write(chunk)
+    def _get_date_ranges(self):
+        paginator = self.get_new_paginator()
 
-            filesize = filepath.stat().st_size / 1000**2  # convert to MB
-            self.logger.info("Processing file: %s (%.1f MB)", filepath, filesize)
+        while not paginator.finished:
+            yield paginator.current_value
+            paginator.advance(None)  # date ranges do not depend on the response
 
-            with filepath.open("r") as f:
-                yield from (json.loads(line, parse_float=decimal.Decimal) for line in f)
+    def _download(self, context, next_page_token: DateTimeIntervalTokenType):
+        prepared_request = self.prepare_request(context, next_page_token)
+        response = self.request_decorator(self._request)(prepared_request, context)
+
+        # buffer small date ranges in memory, only rolling over to disk for large ones
+        # (closed once processed by `request_records`)
+        f = tempfile.SpooledTemporaryFile(  # noqa: SIM115
+            32 * 1024**2,  # 32 MB
+            prefix=f"{self.tap_name}-{self.name}-",
+        )
+
+        response.raw.decode_content = True  # decompress raw content as it is read
+
+        # `readinto` on the raw response reads into a new buffer internally anyway, so
+        # copying through a reusable buffer would not save any allocations
+        with response:  # ensure connection is eventually released
+            shutil.copyfileobj(response.raw, f, EXPORT_DOWNLOAD_CHUNK_SIZE)
+
+        f.seek(0)
+        return prepared_request, response, f
+
+    @override
+    def parse_response(self, response):
+        # parse lines as they are streamed, rather than spooling the response to disk
+        with response:  # ensure connection is eventually released
+            yield from self._parse_lines(
+                response.iter_lines(chunk_size=EXPORT_DOWNLOAD_CHUNK_SIZE)
+            )
 
         self._finalize_state(self.stream_state)
 
+    def _parse_lines(self, lines):
+        for line in lines:
+            if line and not line.isspace():
+                yield orjson.loads(line)
+
     @override
     def post_process(self, row: dict, context=None):
-        if self.primary_keys and (
-            bad_keys := [k for k in self.primary_keys if row.get(k) is None]
-        ):
+        # check for missing primary key values without a Python-level loop in the common
+        # case, only working out which are missing if any are
+        if self.primary_keys and None in map(row.get, self.primary_keys):
+            bad_keys = [k for k in self.primary_keys if row.get(k) is None]
             self.logger.warning(
                 (
                     "Missing or no value for stream primary key properties %s in row, "
@@ -325,11 +448,33 @@ class _ExportStream(IterableStream):
             )
             return None
 
-        if transactional_data := row.get("transactionalData"):
-            row["transactionalData"] = json.loads(transactional_data)
+        return row
+
+
+class _TransactionalExportStream(_ExportStream):
+    """Define export stream with transactional data."""
+
+    @override
+    def post_process(self, row: dict, context=None):
+        row = super().post_process(row, context=context)
+
+        # deselected properties are dropped from the record after post-processing, so
+        # only pay for the parse if the field is actually going to be emitted
+        if row is None or not self._transactional_data_selected:
+            return row
+
+        transactional_data = row.get("transactionalData")
+
+        # only decode serialized data - anything already decoded is passed through
+        if transactional_data and isinstance(transactional_data, (str, bytes)):
+            row["transactionalData"] = orjson.loads(transactional_data)
 
         return row
 
+    @cached_property
+    def _transactional_data_selected(self) -> bool:
+        return self.mask[("properties", "transactionalData")]
+
 
 class EmailBounceStream(_ExportStream):
     """Define email bounce export stream."""
@@ -367,7 +512,7 @@ class EmailOpenStream(_ExportStream):
     data_type_name = "emailOpen"
 
 
-class EmailSendStream(_ExportStream):
+class EmailSendStream(_TransactionalExportStream):
     """Define email send export stream."""
 
     name = "email_send"
@@ -376,7 +521,7 @@ class EmailSendStream(_ExportStream):
     data_type_name = "emailSend"
 
 
-class EmailSendSkipStream(_ExportStream):
+class EmailSendSkipStream(_TransactionalExportStream):
     """Define email send skip export stream."""
 
     name = "email_send_skip"
@@ -403,7 +548,7 @@ class EmailUnsubscribeStream(_ExportStream):
     data_type_name = "emailUnsubscribe"
 
 
-class SMSBounceStream(_ExportStream):
+class SMSBounceStream(_TransactionalExportStream):
     """Define SMS bounce export stream."""
 
     name = "sms_bounce"
@@ -412,7 +557,7 @@ class SMSBounceStream(_ExportStream):
     data_type_name = "smsBounce"
 
 
-class SMSClickStream(_ExportStream):
+class SMSClickStream(_TransactionalExportStream):
     """Define SMS click export stream."""
 
     name = "sms_click"
@@ -430,7 +575,7 @@ class SMSReceivedStream(_ExportStream):
     data_type_name = "smsReceived"
 
 
-class SMSSendStream(_ExportStream):
+class SMSSendStream(_TransactionalExportStream):
     """Define SMS send export stream."""
 
     name = "sms_send"
@@ -439,7 +584,7 @@ class SMSSendStream(_ExportStream):
     data_type_name = "smsSend"
 
 
-class SMSSendSkipStream(_ExportStream):
+class SMSSendSkipStream(_TransactionalExportStream):
     """Define SMS send skip export stream."""
 
     name = "sms_send_skip"
@@ -448,7 +593,7 @@ class SMSSendSkipStream(_ExportStream):
     data_type_name = "smsSendSkip"
 
 
-class WebPushClickStream(_ExportStream):
+class WebPushClickStream(_TransactionalExportStream):
     """Define web push click export stream."""
 
     name = "web_push_click"
@@ -457,7 +602,7 @@ class WebPushClickStream(_ExportStream):
     data_type_name = "webPushClick"
 
 
-class WebPushSendStream(_ExportStream):
+class WebPushSendStream(_TransactionalExportStream):
     """Define web push send export stream."""
 
     name = "web_push_send"
@@ -466,7 +611,7 @@ class WebPushSendStream(_ExportStream):
     data_type_name = "webPushSend"
 
 
-class WebPushSendSkipStream(_ExportStream):
+class WebPushSendSkipStream(_TransactionalExportStream):
     """Define web push send skip export stream."""
 
     name = "web_push_send_skip"
@@ -511,7 +656,7 @@ class WhatsAppSeenStream(_ExportStream):
     data_type_name = "whatsAppSeen"
 
 
-class WhatsAppSendStream(_ExportStream):
+class WhatsAppSendStream(_TransactionalExportStream):
     """Define WhatsApp send export stream."""
 
     name = "whatsapp_send"
@@ -520,7 +665,7 @@ class WhatsAppSendStream(_ExportStream):
     data_type_name = "whatsAppSend"
 
 
-class WhatsAppSendSkipStream(_ExportStream):
+class WhatsAppSendSkipStream(_TransactionalExportStream):
     """Define WhatsApp send skip export stream."""
 
     name = "whatsapp_send_skip"
@@ -538,6 +683,10 @@ class UsersStream(_ExportStream):
 
     data_type_name = "user"
 
+    @cached_property
+    def _known_properties(self):
+        return frozenset(self.schema["properties"])
+
     @override
     def post_process(self, row, context=None):
         row = super().post_process(row, context)
@@ -549,17 +698,15 @@ class UsersStream(_ExportStream):
         # use a `dataFields` schema property as to encapsulate all project-specific user
         # fields in order to avoid overhead/complexity of dynamic discovery
 
-        data_fields = {
-            f: row.pop(f) for f in row.copy() if f not in self.schema["properties"]
-        }
+        # collect unknown fields in their source order, so records are reproducible
+        unknown_fields = [f for f in row if f not in self._known_properties]
+        data_fields = {f: row.pop(f) for f in unknown_fields}
+        row["dataFields"] = data_fields
 
-        return {
-            **row,
-            "dataFields": data_fields,
-        }
+        return row
 
 
-class CustomEventStream(_ExportStream):
+class CustomEventStream(_TransactionalExportStream):
     """Define custom event export stream."""
 
     name = "custom_event"
@@ -575,6 +722,7 @@ class ExperimentMetrics(IterableStream):
     state_partitioning_keys = ()
     name = "experiment_metrics"
     path = "/experiments/metrics"
+    stream_response = True
 
     # https://support.iterable.com/hc/en-us/articles/213805923-Metric-Definitions
     schema = th.PropertiesList(
@@ -648,69 +796,94 @@ class ExperimentMetrics(IterableStream):
 
     @override
     def parse_response(self, response):
-        with io.StringIO(response.text) as f:
-            for row in csv.DictReader(f):
-                # remove extra values
-                if None in row:
-                    del row[None]
-
-                yield row
-
-    @override
-    def post_process(self, row, context=None):
-        row = super().post_process(row, context=context)
-
-        properties: dict = self.schema["properties"]
-
-        for k in list(row.keys()):
-            new_key = k.lower()
-            new_key = new_key.replace("/ m", "per mile")
-            new_key = re.sub(r"\s", "_", new_key)
-            new_key = re.sub(r"[\W]", "", new_key)
-            new_key = humps.camelize(new_key)
-
-            value = row.pop(k)
-
-            if value == "":
-                row[new_key] = value = None
+        response.raw.decode_content = True  # decompress raw content as it is read
+
+        # parse rows as they are streamed, rather than reading the whole response into
+        # memory
+        with (
+            response,  # ensure connection is eventually released
+            io.TextIOWrapper(
+                response.raw,
+                encoding=response.encoding or "utf-8",
+                newline="",
+            ) as f,
+        ):
+            reader = csv.reader(f)
+
+            # normalize header once per response, rather than row keys per record
+            keys = [_normalize_key(k) for k in next(reader, ())]
+
+            # select only columns defined in the schema once per response as well
+            selectors = [k in self._numeric_typecasts for k in keys]
+            keys = list(itertools.compress(keys, selectors))
+
+            # resolve how each column is coerced up front, so rows can be built in
+            # their final form directly
+            coercers = [self._get_value_coercer(k) for k in keys]
+
+            for values in reader:
+                if not values:
+                    continue  # skip blank lines, as `csv.DictReader` does
+
+                # extra values are ignored
+                yield {
+                    k: coerce(v)
+                    for k, coerce, v in zip(
+                        keys,
+                        coercers,
+                        itertools.compress(values, selectors),
+                    )
+                }
 
-            if value is None or not (property_schema := properties.get(new_key)):
-                continue
+    @cached_property
+    def _numeric_typecasts(self):
+        properties: dict[str, dict] = self.schema["properties"]
 
-            numeric_typecasts: dict[th._NumericType] = {
-                th.IntegerType: int,
-                th.NumberType: float,
-            }
+        numeric_typecasts: dict[th._NumericType] = {
+            th.IntegerType: int,
+            th.NumberType: float,
+        }
 
-            numeric_typecast = next(
+        return {
+            name: next(
                 (
                     numeric_typecasts[nt]
                     for nt in numeric_typecasts
-                    if nt.__type_name__ in property_schema["type"]
+                    if nt.__type_name__ in schema["type"]
                 ),
                 None,
             )  # get the first matching typecast if one exists
+            for name, schema in properties.items()
+        }
 
-            if numeric_typecast:
-                try:
-                    d = decimal.Decimal(value)
-                except decimal.DecimalException:
-                    d = decimal.Decimal(math.nan)
-                    self.logger.debug("Handling invalid decimal '%s' as %s", value, d)
-
-                if d.is_nan() or d.is_infinite():
-                    value = None
-                    self.logger.debug(
-                        (
-                            "%s is not supported as a numeric value in JSON, handling "
-                            "as %s"
-                        ),
-                        d,
-                        value,
-                    )
-                else:
-                    value = numeric_typecast(d)
+    def _get_value_coercer(self, name: str):
+        numeric_typecast = self._numeric_typecasts[name]
 
-            row[new_key] = value
+        if not numeric_typecast:
+            return lambda value: value or None  # empty string as null
 
-        return row
+        def coerce(value: str):
+            return self._typecast_number(value, numeric_typecast) if value else None
+
+        return coerce
+
+    def _typecast_number(self, value: str, numeric_typecast: type[int | float]):
+        if numeric_typecast is int:
+            with contextlib.suppress(ValueError):
+                return int(value)  # exact for integer values
+
+        try:
+            n = float(value)
+        except ValueError:
+            n = math.nan
+            self.logger.debug("Handling invalid number '%s' as %s", value, n)
+
+        if not math.isfinite(n):
+            self.logger.debug(
+                "%s is not supported as a numeric value in JSON, handling as %s",
+                n,
+                None,
+            )
+            return None
+
+        return numeric_typecast(n)
@@ -41,6 +41,24 @@ class TapIterable(Tap):
             th.DateTimeType,
             description="Timestamp in ISO 8601 format to get data up to (inclusive)",
         ),
+        th.Property(
+            "export_concurrency",
+            th.IntegerType(minimum=1),
+            default=4,
+            title="Export concurrency",
+            description=(
+                "Maximum number of export date ranges to download concurrently (`1` "
+                "streams each date range directly from the API without buffering to "
+                "disk)"
+            ),
+        ),
+        th.Property(
+            "metadata_concurrency",
+            th.IntegerType(minimum=1),
+            default=10,
+            title="Metadata concurrency",
+            description="Maximum number of metadata keys to request concurrently",
+        ),
     ).to_dict()
 
     @override
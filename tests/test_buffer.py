@@ -0,0 +1,78 @@
+"""Tests for the `BufferDeque` helper."""
+
+# ruff: noqa: S101, SLF001
+
+import pickle
+
+from tap_iterable import BufferDeque
+
+
+def test_full_at_maxlen():
+    """Buffer is full once it holds `maxlen` items."""
+    buffer = BufferDeque([1, 2], maxlen=3)
+    assert not buffer.full
+
+    buffer.append(3)
+    assert buffer.full
+
+
+def test_full_at_max_size():
+    """Buffer is full once the total size of its items reaches `max_size`."""
+    buffer = BufferDeque(["ab"], maxlen=10, max_size=6, sizeof=len)
+    buffer.append("cd")
+    assert not buffer.full
+
+    buffer.append("ef")
+    assert buffer.full
+
+
+def test_size_accounts_for_eviction():
+    """Items evicted at `maxlen` no longer count towards the size."""
+    buffer = BufferDeque(maxlen=3, sizeof=lambda item: item)
+
+    for item in range(1, 6):
+        buffer.append(item)
+
+    assert list(buffer) == [3, 4, 5]
+    assert buffer._size == sum(buffer)
+
+    buffer.clear()
+    assert buffer._size == 0
+
+
+def test_pickle():
+    """Buffer can be pickled with the default `sizeof`."""
+    buffer = BufferDeque([1, 2], maxlen=5, max_size=4)
+    unpickled = pickle.loads(pickle.dumps(buffer))  # noqa: S301
+
+    assert list(unpickled) == [1, 2]
+    assert unpickled.maxlen == buffer.maxlen
+    assert unpickled.max_size == buffer.max_size
+    assert unpickled._size == buffer._size
+
+
+def test_context_flushes_when_ready():
+    """Buffer is only cleared on exit when full or finalized."""
+    buffer = BufferDeque(maxlen=2)
+    buffer.append(1)
+
+    with buffer:
+        pass
+
+    assert list(buffer) == [1]
+
+    buffer.append(2)
+
+    with buffer:
+        assert buffer.flush
+
+    assert not buffer
+
+    buffer.append(3)
+    buffer.finalize()
+    assert buffer.ready
+
+    with buffer:
+        pass
+
+    assert not buffer
@@ -0,0 +1,64 @@
+"""Tests for parsing experiment metrics CSV responses."""
+
+# ruff: noqa: S101
+
+import io
+
+import requests
+
+from tap_iterable.tap import TapIterable
+
+
+def _parse(body: bytes) -> list[dict]:
+    tap = TapIterable(config={"api_key": "x"}, parse_env_config=False)
+    stream = tap.streams["experiment_metrics"]
+
+    response = requests.Response()
+    response.status_code = 200
+    response.raw = io.BytesIO(body)
+    response.encoding = "utf-8"
+
+    return list(stream.parse_response(response))
+
+
+def test_parse_response():
+    """Rows are keyed by normalized header and coerced to their schema types."""
+    records = _parse(
+        b"Campaign Id,Experiment Id,Template Id,Improvement,Name,Total Email Sends\r\n"
+        b"1,2,3.0,4.5,a,10,extra\r\n"  # int given as float, extra trailing value
+        b"\r\n"  # blank line
+        b"5,6,,nan\r\n"  # empty cell, non-finite number, short row
+        b"7,8,9,z,b,\r\n"  # invalid number, empty trailing cell
+    )
+
+    assert records == [
+        {
+            "campaignId": 1,
+            "experimentId": 2,
+            "templateId": 3,
+            "improvement": 4.5,
+            "name": "a",
+            "totalEmailSends": 10,
+        },
+        {
+            "campaignId": 5,
+            "experimentId": 6,
+            "templateId": None,
+            "improvement": None,
+        },
+        {
+            "campaignId": 7,
+            "experimentId": 8,
+            "templateId": 9,
+            "improvement": None,
+            "name": "b",
+            "totalEmailSends": None,
+        },
+    ]
+
+
+def test_parse_response_ignores_unknown_columns():
+    """Columns not defined in the schema are dropped."""
+    records = _parse(b"Campaign Id,Not A Metric\r\n1,x\r\n")
+
+    assert records == [{"campaignId": 1}]